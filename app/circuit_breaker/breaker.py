@@ -4,6 +4,16 @@ from collections import deque
 
 from app.models.processor import CircuitBreakerState
 
+# Internal int-coded states.  CLOSED is 0 so the per-request fast path is a
+# single truthiness test instead of an enum comparison chain; the public
+# CircuitBreakerState enum is mapped back at the API boundary only.
+_CLOSED, _OPEN, _HALF_OPEN = 0, 1, 2
+_STATE_ENUMS = (
+    CircuitBreakerState.CLOSED,
+    CircuitBreakerState.OPEN,
+    CircuitBreakerState.HALF_OPEN,
+)
+
 
 class CircuitBreaker:
     """
@@ -31,17 +41,30 @@ class CircuitBreaker:
     ):
         self.name = name
         self._window_size = window_size
-        self._window_seconds = window_seconds
         self._trip_threshold = trip_threshold
-        self._cooldown_seconds = cooldown_seconds
-
-        # Each entry: (timestamp: float, success: bool)
-        self._window: deque[tuple[float, bool]] = deque()
+        # Hot paths compare timestamps from time.monotonic_ns() — an integer
+        # clock with no boxed-float allocation — so the window and cooldown
+        # bounds are precomputed in nanoseconds once.
+        self._window_ns = int(window_seconds * 1e9)
+        self._cooldown_ns = int(cooldown_seconds * 1e9)
+
+        # Window samples in structure-of-arrays layout: timestamps and
+        # success flags live in two parallel deques advanced in lockstep,
+        # avoiding a 2-tuple allocation per sample and letting eviction scan
+        # timestamps without touching the success flags.  maxlen makes each
+        # deque evict the oldest sample automatically on append (C-level,
+        # O(1)) so only time-based eviction needs a Python loop.
+        self._timestamps: deque[int] = deque(maxlen=self._window_size)
+        self._successes: deque[bool] = deque(maxlen=self._window_size)
+        # Running count of successes in the window, maintained incrementally on
+        # append/evict so trip evaluation and snapshots stay O(1) instead of
+        # re-scanning the whole window under the lock.
+        self._success_count = 0
         self._lock = threading.Lock()
 
-        self._state = CircuitBreakerState.CLOSED
-        self._opened_at: float | None = None
-        self._last_failure_at: float | None = None
+        self._state = _CLOSED
+        self._opened_at: int | None = None
+        self._last_failure_at: int | None = None
         self._half_open_probe_in_flight = False
 
     def allow_request(self) -> bool:
@@ -49,21 +72,30 @@ class CircuitBreaker:
         Returns True if a request should be allowed through.
         Side effect: transitions OPEN -> HALF_OPEN when cooldown elapses.
         """
+        # Lock-free fast path: _state is a single attribute and reads are
+        # atomic under the GIL.  The common CLOSED case (healthy processor)
+        # skips lock acquisition entirely; only OPEN/HALF_OPEN, where a
+        # transition may happen, need the lock.
+        if not self._state:  # _CLOSED == 0
+            return True
+
         with self._lock:
-            if self._state == CircuitBreakerState.CLOSED:
+            # Re-check under the lock — another thread may have transitioned
+            # the state between the fast-path read and acquiring the lock.
+            if self._state == _CLOSED:
                 return True
 
-            if self._state == CircuitBreakerState.OPEN:
+            if self._state == _OPEN:
                 if self._opened_at is not None:
-                    elapsed = time.monotonic() - self._opened_at
-                    if elapsed >= self._cooldown_seconds:
+                    elapsed = time.monotonic_ns() - self._opened_at
+                    if elapsed >= self._cooldown_ns:
                         # Transition to HALF_OPEN and allow one probe
-                        self._state = CircuitBreakerState.HALF_OPEN
+                        self._state = _HALF_OPEN
                         self._half_open_probe_in_flight = True
                         return True
                 return False
 
-            if self._state == CircuitBreakerState.HALF_OPEN:
+            if self._state == _HALF_OPEN:
                 # Only allow one probe at a time
                 if not self._half_open_probe_in_flight:
                     self._half_open_probe_in_flight = True
@@ -74,53 +106,63 @@ class CircuitBreaker:
 
     def record_success(self) -> None:
         with self._lock:
-            self._add_sample(success=True)
-            if self._state == CircuitBreakerState.HALF_OPEN:
+            self._add_sample(time.monotonic_ns(), success=True)
+            if self._state == _HALF_OPEN:
                 # Probe succeeded — recover to CLOSED
-                self._state = CircuitBreakerState.CLOSED
+                self._state = _CLOSED
                 self._opened_at = None
                 self._half_open_probe_in_flight = False
 
     def record_failure(self) -> None:
         with self._lock:
-            self._last_failure_at = time.monotonic()
-            self._add_sample(success=False)
+            # One clock read shared by the failure timestamp, the sample, and
+            # a potential OPEN transition.
+            now = time.monotonic_ns()
+            self._last_failure_at = now
+            self._add_sample(now, success=False)
 
-            if self._state == CircuitBreakerState.HALF_OPEN:
+            if self._state == _HALF_OPEN:
                 # Probe failed — go back to OPEN and reset cooldown
-                self._state = CircuitBreakerState.OPEN
-                self._opened_at = time.monotonic()
+                self._state = _OPEN
+                self._opened_at = now
                 self._half_open_probe_in_flight = False
-            elif self._state == CircuitBreakerState.CLOSED:
+            elif self._state == _CLOSED:
                 self._evaluate_trip()
 
-    def _add_sample(self, success: bool) -> None:
-        now = time.monotonic()
-        self._window.append((now, success))
+    def _add_sample(self, now: int, success: bool) -> None:
+        # maxlen eviction is silent, so account for the sample it will push out
+        # before appending.
+        if len(self._timestamps) == self._window_size and self._successes[0]:
+            self._success_count -= 1
+        self._timestamps.append(now)
+        self._successes.append(success)
+        if success:
+            self._success_count += 1
         self._evict_stale(now)
 
-    def _evict_stale(self, now: float) -> None:
-        cutoff = now - self._window_seconds
-        while self._window and self._window[0][0] < cutoff:
-            self._window.popleft()
-        while len(self._window) > self._window_size:
-            self._window.popleft()
+    def _evict_stale(self, now: int) -> None:
+        cutoff = now - self._window_ns
+        while self._timestamps and self._timestamps[0] < cutoff:
+            self._timestamps.popleft()
+            if self._successes.popleft():
+                self._success_count -= 1
 
     def _evaluate_trip(self) -> None:
-        if len(self._window) < 5:
+        if len(self._timestamps) < 5:
             # Need at least 5 samples before tripping
             return
-        success_count = sum(1 for _, s in self._window if s)
-        rate = success_count / len(self._window)
+        rate = self._success_count / len(self._timestamps)
         if rate < self._trip_threshold:
-            self._state = CircuitBreakerState.OPEN
-            self._opened_at = time.monotonic()
+            self._state = _OPEN
+            self._opened_at = time.monotonic_ns()
 
     def reset(self) -> None:
         """Reset to CLOSED state with an empty window (for testing / admin)."""
         with self._lock:
-            self._window.clear()
-            self._state = CircuitBreakerState.CLOSED
+            self._timestamps.clear()
+            self._successes.clear()
+            self._success_count = 0
+            self._state = _CLOSED
             self._opened_at = None
             self._last_failure_at = None
             self._half_open_probe_in_flight = False
@@ -133,39 +175,62 @@ class CircuitBreaker:
         Intended for demo / integration-testing only.
         """
         with self._lock:
+            now = time.monotonic_ns()
             for _ in range(count):
-                self._add_sample(success=False)
-            self._last_failure_at = time.monotonic()
-            if self._state == CircuitBreakerState.CLOSED:
+                self._add_sample(now, success=False)
+            self._last_failure_at = now
+            if self._state == _CLOSED:
                 self._evaluate_trip()
 
+    def would_reject(self) -> bool:
+        """
+        Non-mutating lock-free check: True only when the circuit is OPEN with
+        the cooldown still running, i.e. allow_request() would reject without
+        performing any state transition.  Lets callers pre-screen a chain of
+        breakers without triggering OPEN -> HALF_OPEN probes.
+        """
+        if self._state != _OPEN:
+            return False
+        opened_at = self._opened_at
+        return (
+            opened_at is not None
+            and time.monotonic_ns() - opened_at < self._cooldown_ns
+        )
+
     @property
     def status_snapshot(self) -> dict:
         """Thread-safe snapshot for the /processors/status endpoint."""
+        # Gather raw numeric values under the lock; all derived arithmetic and
+        # string formatting happens after release to keep the critical section
+        # minimal.
         with self._lock:
-            now = time.monotonic()
+            now = time.monotonic_ns()
             self._evict_stale(now)
-            total = len(self._window)
-            successes = sum(1 for _, s in self._window if s)
-            failures = total - successes
-            rate = (successes / total) if total > 0 else None
-
-            cooldown_remaining = None
-            if self._state == CircuitBreakerState.OPEN and self._opened_at is not None:
-                elapsed = now - self._opened_at
-                cooldown_remaining = max(0.0, self._cooldown_seconds - elapsed)
-
-            last_failure = None
-            if self._last_failure_at is not None:
-                seconds_ago = now - self._last_failure_at
-                last_failure = f"{seconds_ago:.1f}s ago"
-
-            return {
-                "state": self._state,
-                "success_rate": rate,
-                "total_calls_in_window": total,
-                "successful_calls_in_window": successes,
-                "failed_calls_in_window": failures,
-                "last_failure_at": last_failure,
-                "cooldown_remaining_seconds": cooldown_remaining,
-            }
+            total = len(self._timestamps)
+            successes = self._success_count
+            state = self._state
+            opened_at = self._opened_at
+            last_failure_at = self._last_failure_at
+
+        failures = total - successes
+        rate = (successes / total) if total > 0 else None
+
+        cooldown_remaining = None
+        if state == _OPEN and opened_at is not None:
+            elapsed = now - opened_at
+            cooldown_remaining = max(0.0, (self._cooldown_ns - elapsed) / 1e9)
+
+        last_failure = None
+        if last_failure_at is not None:
+            seconds_ago = (now - last_failure_at) / 1e9
+            last_failure = f"{seconds_ago:.1f}s ago"
+
+        return {
+            "state": _STATE_ENUMS[state],
+            "success_rate": rate,
+            "total_calls_in_window": total,
+            "successful_calls_in_window": successes,
+            "failed_calls_in_window": failures,
+            "last_failure_at": last_failure,
+            "cooldown_remaining_seconds": cooldown_remaining,
+        }
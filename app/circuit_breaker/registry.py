@@ -1,3 +1,5 @@
+import threading
+
 from app.circuit_breaker.breaker import CircuitBreaker
 from app.config import Settings
 
@@ -11,17 +13,28 @@ class CircuitBreakerRegistry:
     def __init__(self, settings: Settings):
         self._breakers: dict[str, CircuitBreaker] = {}
         self._settings = settings
+        self._init_lock = threading.Lock()
 
     def get(self, processor_name: str) -> CircuitBreaker:
-        if processor_name not in self._breakers:
-            self._breakers[processor_name] = CircuitBreaker(
-                name=processor_name,
-                window_size=self._settings.CB_ROLLING_WINDOW_SIZE,
-                window_seconds=self._settings.CB_ROLLING_WINDOW_SECONDS,
-                trip_threshold=self._settings.CB_TRIP_THRESHOLD,
-                cooldown_seconds=self._settings.CB_COOLDOWN_SECONDS,
-            )
-        return self._breakers[processor_name]
+        # Double-checked locking: dict.get is GIL-atomic, so the common
+        # "already registered" path pays no lock.  The lock only guards first
+        # construction, preventing two concurrent first-hits from building two
+        # breakers and losing one's state.
+        cb = self._breakers.get(processor_name)
+        if cb is not None:
+            return cb
+        with self._init_lock:
+            cb = self._breakers.get(processor_name)
+            if cb is None:
+                cb = CircuitBreaker(
+                    name=processor_name,
+                    window_size=self._settings.CB_ROLLING_WINDOW_SIZE,
+                    window_seconds=self._settings.CB_ROLLING_WINDOW_SECONDS,
+                    trip_threshold=self._settings.CB_TRIP_THRESHOLD,
+                    cooldown_seconds=self._settings.CB_COOLDOWN_SECONDS,
+                )
+                self._breakers[processor_name] = cb
+        return cb
 
     def all_names(self) -> list[str]:
         return list(self._breakers.keys())
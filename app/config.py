@@ -16,6 +16,10 @@ class Settings(BaseSettings):
     # Per-processor call timeout
     PROCESSOR_TIMEOUT_SECONDS: float = 3.0
 
+    # Idempotency cache size bound (entries across all shards); oldest
+    # entries are evicted first when exceeded, independent of TTL
+    IDEMPOTENCY_MAX_ENTRIES: int = 100_000
+
     model_config = {"env_file": ".env", "env_file_encoding": "utf-8"}
 
 
@@ -1,8 +1,9 @@
 import asyncio
 import logging
-import threading
+import sys
 import time
-from datetime import datetime, timezone
+from collections import deque
+from datetime import datetime, timedelta, timezone
 
 from app.processors.base import AbstractProcessor
 from app.circuit_breaker.registry import CircuitBreakerRegistry
@@ -14,13 +15,35 @@ from app.config import Settings
 
 logger = logging.getLogger(__name__)
 
-_IDEMPOTENCY_TTL_SECONDS = 86_400  # 24 hours
+_UTC = timezone.utc
 
-# Sentinel stored in the cache while a coroutine is processing a transaction.
-# Any concurrent request that finds this sentinel falls through and processes
-# independently — both produce the same idempotent outcome and the last
-# _store_and_evict call wins.
-_PROCESSING = object()
+_IDEMPOTENCY_TTL_NS = 86_400 * 1_000_000_000  # 24 hours, in monotonic_ns units
+
+# How often the background sweeper wakes to prune expired idempotency entries.
+# Coarse relative to the 24h TTL: a stale entry lingering up to a minute past
+# expiry is invisible to callers because _check_and_claim re-validates the TTL
+# on every hit.
+_EVICTION_INTERVAL_SECONDS = 60.0
+
+# Number of idempotency-cache stripes; must be a power of two so the shard
+# index reduces to a single bitwise AND on the key hash.
+_CACHE_SHARDS = 16
+
+# Outcome-routing action codes, resolved per attempt via one dict hit instead
+# of a chain of enum comparisons.  SOFT_DECLINE and TIMEOUT share an action:
+# both mean "move to the next processor".
+_ACT_SUCCESS = 0
+_ACT_HARD_DECLINE = 1
+_ACT_RATE_LIMITED = 2
+_ACT_NEXT_PROCESSOR = 3
+
+_STATUS_ACTIONS = {
+    ProcessorResultStatus.SUCCESS: _ACT_SUCCESS,
+    ProcessorResultStatus.HARD_DECLINE: _ACT_HARD_DECLINE,
+    ProcessorResultStatus.RATE_LIMITED: _ACT_RATE_LIMITED,
+    ProcessorResultStatus.SOFT_DECLINE: _ACT_NEXT_PROCESSOR,
+    ProcessorResultStatus.TIMEOUT: _ACT_NEXT_PROCESSOR,
+}
 
 
 class FallbackEngine:
@@ -54,154 +77,370 @@ class FallbackEngine:
         self._cb_registry = cb_registry
         self._stats = stats_service
         self._settings = settings
-        # Idempotency cache: transaction_id -> (cached_at: float, response | _PROCESSING)
-        self._idempotency_cache: dict[str, tuple[float, object]] = {}
-        self._cache_lock = threading.Lock()
+        # The processor list is fixed for the lifetime of the engine, so both
+        # routing orders are computed once here instead of re-sorting on every
+        # request.  Default: cost-aware, cheapest first.  BRL: PixFlow first
+        # (native PIX support), then the rest cheapest-first.
+        self._default_order: tuple[AbstractProcessor, ...] = tuple(
+            sorted(processors, key=lambda p: p.fee_rate)
+        )
+        self._brl_order: tuple[AbstractProcessor, ...] = tuple(
+            [p for p in processors if p.name == "PixFlow"]
+            + sorted(
+                [p for p in processors if p.name != "PixFlow"],
+                key=lambda p: p.fee_rate,
+            )
+        )
+        # Processor -> breaker resolved once; the registry is fixed after
+        # startup, so the per-attempt name-keyed registry lookup collapses to
+        # an identity-hashed dict hit.
+        self._cb_for = {p: cb_registry.get(p.name) for p in processors}
+        # The set of possible processors_tried labels that don't depend on a
+        # dynamic decline code is small and fixed (names x statuses x retry
+        # index), so every one is formatted and interned once here; the hot
+        # loop then appends by dict lookup instead of building f-strings.
+        self._success_labels = {
+            p.name: sys.intern(f"{p.name}(success)") for p in processors
+        }
+        self._circuit_open_labels = {
+            p.name: sys.intern(f"{p.name}(circuit_open)") for p in processors
+        }
+        self._rate_limit_retry_labels = {
+            p.name: tuple(
+                sys.intern(f"{p.name}(rate_limited:retry_{i})")
+                for i in range(1, settings.BACKOFF_MAX_RETRIES + 1)
+            )
+            for p in processors
+        }
+        self._rate_limit_exhausted_labels = {
+            p.name: sys.intern(f"{p.name}(rate_limited:exhausted)")
+            for p in processors
+        }
+        # Idempotency cache, sharded to avoid funnelling every transaction
+        # through one global lock: transaction_id hashes to one of
+        # _CACHE_SHARDS stripes, each a (dict, Lock) pair mapping
+        # transaction_id -> (cached_at_ns: int, response).
+        # Unrelated transaction_ids hit different stripes and never contend.
+        # The cache is only ever touched from async request handlers, so the
+        # stripes use asyncio.Lock: an uncontended acquire is a plain Python
+        # call on the event loop instead of a futex syscall, and a contended
+        # one yields to the loop rather than blocking it.
+        self._cache_shards: list[tuple[dict[str, tuple[int, object]], asyncio.Lock]] = [
+            ({}, asyncio.Lock()) for _ in range(_CACHE_SHARDS)
+        ]
+        # Size bound independent of the TTL so the cache cannot grow without
+        # limit under a replay flood; enforced per shard, evicting oldest
+        # first.
+        self._max_entries_per_shard = max(
+            1, settings.IDEMPOTENCY_MAX_ENTRIES // _CACHE_SHARDS
+        )
+        # Stat records are pushed onto this queue from the request path and
+        # applied in batches by a background consumer, keeping the
+        # StatsService lock off the per-attempt critical path.  When no
+        # consumer is running (unit tests, scripts) the queue is drained
+        # synchronously at the end of each transaction.
+        self._stats_queue: asyncio.Queue[tuple] = asyncio.Queue()
+        self._stats_task: asyncio.Task | None = None
+        # Background TTL sweeper; pruning happens on a coarse timer instead of
+        # on every store, keeping expiry scans off the request path.
+        self._eviction_task: asyncio.Task | None = None
+
+    def start_stats_worker(self) -> None:
+        """Start the background stats consumer (called from app lifespan)."""
+        if self._stats_task is None:
+            self._stats_task = asyncio.get_running_loop().create_task(
+                self._stats_worker()
+            )
+
+    async def stop_stats_worker(self) -> None:
+        """Stop the consumer, applying any records still queued."""
+        if self._stats_task is not None:
+            self._stats_task.cancel()
+            try:
+                await self._stats_task
+            except asyncio.CancelledError:
+                pass
+            self._stats_task = None
+        self._drain_stats_queue()
+
+    def _drain_stats_queue(self) -> None:
+        batch = []
+        while not self._stats_queue.empty():
+            batch.append(self._stats_queue.get_nowait())
+        if batch:
+            self._stats.apply_batch(batch)
+
+    async def _stats_worker(self) -> None:
+        queue = self._stats_queue
+        while True:
+            batch = [await queue.get()]
+            while not queue.empty():
+                batch.append(queue.get_nowait())
+            self._stats.apply_batch(batch)
+
+    def start_eviction_loop(self) -> None:
+        """Start the background TTL sweeper (called from app lifespan)."""
+        if self._eviction_task is None:
+            self._eviction_task = asyncio.get_running_loop().create_task(
+                self._eviction_loop()
+            )
 
-    def _check_and_claim(self, transaction_id: str) -> TransactionResponse | None:
+    async def stop_eviction_loop(self) -> None:
+        if self._eviction_task is not None:
+            self._eviction_task.cancel()
+            try:
+                await self._eviction_task
+            except asyncio.CancelledError:
+                pass
+            self._eviction_task = None
+
+    async def _eviction_loop(self) -> None:
+        """
+        Periodic TTL sweep over all cache shards.
+
+        Entries are stored in monotonic time order, so expired entries sit at
+        the front of each shard dict: each sweep pops from the front until it
+        hits the first live entry, then moves on.  Shards are pruned one at a
+        time under their own lock, so a sweep never stalls more than one
+        stripe of request traffic at once.
+        """
+        while True:
+            await asyncio.sleep(_EVICTION_INTERVAL_SECONDS)
+            cutoff = time.monotonic_ns() - _IDEMPOTENCY_TTL_NS
+            for cache, lock in self._cache_shards:
+                async with lock:
+                    while cache:
+                        oldest_key = next(iter(cache))
+                        if cache[oldest_key][0] >= cutoff:
+                            break
+                        del cache[oldest_key]
+
+    def _shard_for(self, transaction_id: str) -> tuple[dict[str, tuple[int, object]], asyncio.Lock]:
+        return self._cache_shards[hash(transaction_id) & (_CACHE_SHARDS - 1)]
+
+    async def _check_and_claim(self, transaction_id: str) -> TransactionResponse | None:
         """
         Single-lock check-and-claim.
 
-        Under one lock acquisition this method either:
-          a) returns the valid cached TransactionResponse, or
-          b) inserts _PROCESSING to claim the slot and returns None
-             (the caller must then process and call _store_and_evict).
+        Under one lock acquisition this method either returns the valid
+        cached TransactionResponse, or returns None (the caller must then
+        process and call _store_and_evict).
 
-        This eliminates the TOCTOU window that existed when check and store
-        were two separate lock acquisitions with async processing in between.
+        There is no in-flight marker: a concurrent duplicate that arrives
+        mid-flight processes independently — both produce the same idempotent
+        outcome and the last _store_and_evict call wins.
         """
-        with self._cache_lock:
-            entry = self._idempotency_cache.get(transaction_id)
-            if entry is not None:
-                cached_at, payload = entry
-                if time.monotonic() - cached_at <= _IDEMPOTENCY_TTL_SECONDS:
-                    if payload is not _PROCESSING:
-                        return payload  # type: ignore[return-value]
-                    # Another coroutine already claimed this slot; let this one
-                    # fall through — both produce the same idempotent outcome.
-                    return None
-                # Expired entry — evict and fall through to claim
-                del self._idempotency_cache[transaction_id]
-            # Claim the slot atomically before releasing the lock
-            self._idempotency_cache[transaction_id] = (time.monotonic(), _PROCESSING)
+        cache, lock = self._shard_for(transaction_id)
+        async with lock:
+            # EAFP: the try costs nothing when the key is present (replay
+            # hits unpack straight from the subscript), and the miss path
+            # drops the .get() method-call and None-compare overhead.
+            try:
+                cached_at, response = cache[transaction_id]
+            except KeyError:
+                return None
+            if time.monotonic_ns() - cached_at <= _IDEMPOTENCY_TTL_NS:
+                return response  # type: ignore[return-value]
+            # Expired entry — evict and treat as a fresh transaction
+            del cache[transaction_id]
             return None
 
-    def _store_and_evict(self, transaction_id: str, response: TransactionResponse) -> None:
+    async def _store_and_evict(self, transaction_id: str, response: TransactionResponse) -> None:
         """
-        Replace the _PROCESSING placeholder with the final response, then sweep
-        the cache to evict every entry that has exceeded the TTL so the cache
-        stays bounded under sustained traffic.
+        Store the final response.
+
+        TTL expiry is handled by the background _eviction_loop, not here; the
+        only eviction on the write path is the hard size bound, which must
+        stay inline so a replay flood cannot outgrow the cap between sweeps.
         """
-        with self._cache_lock:
-            now = time.monotonic()
-            self._idempotency_cache[transaction_id] = (now, response)
-            stale = [
-                k for k, (ts, _) in self._idempotency_cache.items()
-                if now - ts > _IDEMPOTENCY_TTL_SECONDS
-            ]
-            for k in stale:
-                del self._idempotency_cache[k]
+        cache, lock = self._shard_for(transaction_id)
+        async with lock:
+            # Re-insert rather than overwrite so a duplicate that finished
+            # out of order still lands at the back in completion order.
+            cache.pop(transaction_id, None)
+            cache[transaction_id] = (time.monotonic_ns(), response)
+            while len(cache) > self._max_entries_per_shard:
+                del cache[next(iter(cache))]
 
     async def process(self, request: TransactionRequest) -> TransactionResponse:
-        cached = self._check_and_claim(request.transaction_id)
+        cached = await self._check_and_claim(request.transaction_id)
         if cached is not None:
             logger.info(
-                f"[TXN {request.transaction_id}] Idempotent replay — returning cached response"
+                "[TXN %s] Idempotent replay — returning cached response",
+                request.transaction_id,
             )
             return cached
         start = time.monotonic()
+        # One wall-clock read per transaction; terminal branches derive
+        # processed_at from the monotonic elapsed time instead of paying a
+        # second datetime.now(tz) call.
+        start_wall = datetime.now(_UTC)
         attempts = 0
-        processors_tried: list[str] = []
-        retry_log: list[str] = []
+        # Hoist per-attempt settings out of the loops — each access is a
+        # pydantic descriptor lookup, and these are constant per request.
+        timeout_s = self._settings.PROCESSOR_TIMEOUT_SECONDS
+        timeout_ms = timeout_s * 1000
+        max_retries = self._settings.BACKOFF_MAX_RETRIES
+        backoff_base = self._settings.BACKOFF_BASE_SECONDS
+        backoff_cap = self._settings.BACKOFF_MAX_SECONDS
+        # Pre-bind the queue push and the action table: LOAD_FAST beats
+        # attribute lookups on every attempt.
+        enqueue_stat = self._stats_queue.put_nowait
+        status_actions = _STATUS_ACTIONS
+        # Attempt results accumulate locally and ship as a single queued
+        # record at the terminal, so stats traffic is one queue push per
+        # transaction no matter how many attempts it took.
+        attempt_results: list[ProcessorResult] = []
+        # deque grows in fixed-size blocks and never reallocates on append
+        # the way a list does; materialized once, at exact size, per terminal.
+        processors_tried: deque[str] = deque()
+        # Allocated lazily on the first backoff event — the happy path never
+        # touches it.
+        retry_log: list[str] | None = None
         last_result: ProcessorResult | None = None
 
         # Currency-aware routing: BRL transactions are routed to PixFlow first because
         # PixFlow supports PIX natively, giving it a structural conversion advantage
         # for Brazilian Real payments.  All other currencies use cost-aware ordering
-        # (cheapest processor first).
-        if request.currency == Currency.BRL:
-            pix = [p for p in self._processors if p.name == "PixFlow"]
-            rest = sorted(
-                [p for p in self._processors if p.name != "PixFlow"],
-                key=lambda p: p.fee_rate,
+        # (cheapest processor first).  Both orders are precomputed in __init__.
+        ordered_processors = (
+            self._brl_order if request.currency is Currency.BRL else self._default_order
+        )
+
+        # Guarded so the chain list comprehension only runs when INFO is live.
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "[TXN %s] Processing %s %s | chain: %s",
+                request.transaction_id,
+                request.amount,
+                request.currency,
+                [p.name for p in ordered_processors],
             )
-            ordered_processors = pix + rest
-        else:
-            ordered_processors = sorted(self._processors, key=lambda p: p.fee_rate)
 
-        logger.info(
-            f"[TXN {request.transaction_id}] Processing {request.amount} {request.currency} "
-            f"| chain: {[p.name for p in ordered_processors]}"
-        )
+        # Brown-out fast path: when every breaker is OPEN with its cooldown
+        # still running, no processor would be attempted — skip straight to
+        # the terminal decline instead of walking the loop building synthetic
+        # circuit-open results.  would_reject() is non-mutating, so an OPEN
+        # breaker whose cooldown has elapsed still goes through the loop and
+        # gets its HALF_OPEN probe.
+        if all(self._cb_for[p].would_reject() for p in ordered_processors):
+            enqueue_stat((attempt_results, False, request.amount, None))
+            total_latency_ms = (time.monotonic() - start) * 1000
+            logger.warning(
+                "[TXN %s] All circuit breakers OPEN — declining without attempts",
+                request.transaction_id,
+            )
+            response = TransactionResponse.model_construct(
+                transaction_id=request.transaction_id,
+                status="declined",
+                amount=request.amount,
+                currency=request.currency.value,
+                decline_reason="all_processors_failed",
+                decline_type="soft",
+                attempts=0,
+                processors_tried=[
+                    self._circuit_open_labels[p.name] for p in ordered_processors
+                ],
+                retry_log=[],
+                latency_ms=round(total_latency_ms, 2),
+                processed_at=start_wall + timedelta(milliseconds=total_latency_ms),
+            )
+            if self._stats_task is None:
+                self._drain_stats_queue()
+            await self._store_and_evict(request.transaction_id, response)
+            return response
 
         for processor in ordered_processors:
-            cb = self._cb_registry.get(processor.name)
+            cb = self._cb_for[processor]
 
             # --- Circuit Breaker Guard ---
             if not cb.allow_request():
                 logger.warning(
-                    f"[TXN {request.transaction_id}] [{processor.name}] Circuit OPEN — skipping"
-                )
-                last_result = ProcessorResult(
-                    processor_name=processor.name,
-                    status=ProcessorResultStatus.CIRCUIT_OPEN,
+                    "[TXN %s] [%s] Circuit OPEN — skipping",
+                    request.transaction_id,
+                    processor.name,
                 )
-                processors_tried.append(f"{processor.name}(circuit_open)")
+                # No result object is built for a skipped processor; clearing
+                # last_result makes the terminal branch fall back to its
+                # "all_processors_failed"/soft defaults, exactly as the old
+                # synthetic CIRCUIT_OPEN sentinel did.
+                last_result = None
+                processors_tried.append(self._circuit_open_labels[processor.name])
                 continue
 
             # --- Rate Limit Backoff Loop ---
-            for backoff_attempt in range(self._settings.BACKOFF_MAX_RETRIES + 1):
+            for backoff_attempt in range(max_retries + 1):
                 if backoff_attempt > 0:
                     delay = await exponential_backoff(
                         backoff_attempt - 1,
-                        base=self._settings.BACKOFF_BASE_SECONDS,
-                        cap=self._settings.BACKOFF_MAX_SECONDS,
+                        base=backoff_base,
+                        cap=backoff_cap,
                     )
                     logger.info(
-                        f"[TXN {request.transaction_id}] [{processor.name}] "
-                        f"Backoff retry #{backoff_attempt} after {delay:.2f}s"
+                        "[TXN %s] [%s] Backoff retry #%d after %.2fs",
+                        request.transaction_id,
+                        processor.name,
+                        backoff_attempt,
+                        delay,
                     )
+                    if retry_log is None:
+                        retry_log = []
                     retry_log.append(f"{processor.name}: rate_limited, backoff {delay:.2f}s")
 
                 attempts += 1
 
                 try:
-                    result = await asyncio.wait_for(
-                        processor.charge(request),
-                        timeout=self._settings.PROCESSOR_TIMEOUT_SECONDS,
-                    )
-                except asyncio.TimeoutError:
+                    # asyncio.timeout (3.11+) reuses loop primitives instead of
+                    # wrapping the coroutine in a fresh task per attempt the
+                    # way wait_for does.
+                    async with asyncio.timeout(timeout_s):
+                        result = await processor.charge(request)
+                except TimeoutError:
                     logger.warning(
-                        f"[TXN {request.transaction_id}] [{processor.name}] "
-                        f"Timed out after {self._settings.PROCESSOR_TIMEOUT_SECONDS}s"
+                        "[TXN %s] [%s] Timed out after %ss",
+                        request.transaction_id,
+                        processor.name,
+                        timeout_s,
                     )
                     result = ProcessorResult(
                         processor_name=processor.name,
                         status=ProcessorResultStatus.TIMEOUT,
-                        latency_ms=self._settings.PROCESSOR_TIMEOUT_SECONDS * 1000,
+                        latency_ms=timeout_ms,
                     )
 
                 last_result = result
-                self._stats.record_attempt(result)
+                attempt_results.append(result)
 
                 logger.info(
-                    f"[TXN {request.transaction_id}] [{processor.name}] "
-                    f"attempt={attempts} status={result.status.value} "
-                    f"decline_code={result.decline_code} "
-                    f"latency={result.latency_ms:.1f}ms"
+                    "[TXN %s] [%s] attempt=%d status=%s decline_code=%s latency=%.1fms",
+                    request.transaction_id,
+                    processor.name,
+                    attempts,
+                    result.status.value,
+                    result.decline_code,
+                    result.latency_ms,
                 )
 
                 # --- Outcome Routing ---
-                if result.status == ProcessorResultStatus.SUCCESS:
+                # Unmapped statuses (CIRCUIT_OPEN, anything future) fall
+                # through to the next processor, matching the baseline else
+                # branch.
+                action = status_actions.get(result.status, _ACT_NEXT_PROCESSOR)
+                if action == _ACT_SUCCESS:
                     cb.record_success()
-                    processors_tried.append(f"{processor.name}(success)")
-                    self._stats.record_final(approved=True, amount=request.amount, fee=result.fee)
+                    processors_tried.append(self._success_labels[processor.name])
+                    enqueue_stat((attempt_results, True, request.amount, result.fee))
                     total_latency_ms = (time.monotonic() - start) * 1000
                     logger.info(
-                        f"[TXN {request.transaction_id}] APPROVED via {processor.name} "
-                        f"after {attempts} attempt(s) | total latency={total_latency_ms:.1f}ms"
+                        "[TXN %s] APPROVED via %s after %d attempt(s) | total latency=%.1fms",
+                        request.transaction_id,
+                        processor.name,
+                        attempts,
+                        total_latency_ms,
                     )
-                    response = TransactionResponse(
+                    # model_construct skips validation — every field here is
+                    # engine-produced and already the right type.
+                    response = TransactionResponse.model_construct(
                         transaction_id=request.transaction_id,
                         status="approved",
                         processor_used=processor.name,
@@ -210,24 +449,30 @@ class FallbackEngine:
                         fee=result.fee,
                         fee_rate=result.fee_rate,
                         attempts=attempts,
-                        processors_tried=processors_tried,
-                        retry_log=retry_log,
+                        processors_tried=list(processors_tried),
+                        retry_log=retry_log or [],
                         latency_ms=round(total_latency_ms, 2),
-                        processed_at=datetime.now(timezone.utc),
+                        processed_at=start_wall + timedelta(milliseconds=total_latency_ms),
                     )
-                    self._store_and_evict(request.transaction_id, response)
+                    if self._stats_task is None:
+                        self._drain_stats_queue()
+                    await self._store_and_evict(request.transaction_id, response)
                     return response
 
-                elif result.status == ProcessorResultStatus.HARD_DECLINE:
+                elif action == _ACT_HARD_DECLINE:
                     cb.record_failure()
                     processors_tried.append(f"{processor.name}(hard_decline:{result.decline_code})")
-                    self._stats.record_final(approved=False, amount=request.amount, fee=None)
+                    enqueue_stat((attempt_results, False, request.amount, None))
                     total_latency_ms = (time.monotonic() - start) * 1000
                     logger.warning(
-                        f"[TXN {request.transaction_id}] HARD DECLINE from {processor.name} "
-                        f"code={result.decline_code} — NOT retrying"
+                        "[TXN %s] HARD DECLINE from %s code=%s — NOT retrying",
+                        request.transaction_id,
+                        processor.name,
+                        result.decline_code,
                     )
-                    response = TransactionResponse(
+                    # model_construct skips validation — every field here is
+                    # engine-produced and already the right type.
+                    response = TransactionResponse.model_construct(
                         transaction_id=request.transaction_id,
                         status="declined",
                         processor_used=processor.name,
@@ -236,24 +481,29 @@ class FallbackEngine:
                         decline_reason=result.decline_code,
                         decline_type="hard",
                         attempts=attempts,
-                        processors_tried=processors_tried,
-                        retry_log=retry_log,
+                        processors_tried=list(processors_tried),
+                        retry_log=retry_log or [],
                         latency_ms=round(total_latency_ms, 2),
-                        processed_at=datetime.now(timezone.utc),
+                        processed_at=start_wall + timedelta(milliseconds=total_latency_ms),
                     )
-                    self._store_and_evict(request.transaction_id, response)
+                    if self._stats_task is None:
+                        self._drain_stats_queue()
+                    await self._store_and_evict(request.transaction_id, response)
                     return response
 
-                elif result.status == ProcessorResultStatus.RATE_LIMITED:
+                elif action == _ACT_RATE_LIMITED:
                     cb.record_failure()
-                    if backoff_attempt < self._settings.BACKOFF_MAX_RETRIES:
-                        processors_tried.append(f"{processor.name}(rate_limited:retry_{backoff_attempt+1})")
+                    if backoff_attempt < max_retries:
+                        processors_tried.append(
+                            self._rate_limit_retry_labels[processor.name][backoff_attempt]
+                        )
                         continue  # retry same processor with backoff
                     else:
-                        processors_tried.append(f"{processor.name}(rate_limited:exhausted)")
+                        processors_tried.append(self._rate_limit_exhausted_labels[processor.name])
                         logger.warning(
-                            f"[TXN {request.transaction_id}] [{processor.name}] "
-                            f"Rate limit retries exhausted — falling through"
+                            "[TXN %s] [%s] Rate limit retries exhausted — falling through",
+                            request.transaction_id,
+                            processor.name,
                         )
                         break  # move to next processor
 
@@ -263,16 +513,20 @@ class FallbackEngine:
                         f"{processor.name}({result.status.value}:{result.decline_code or 'n/a'})"
                     )
                     logger.info(
-                        f"[TXN {request.transaction_id}] [{processor.name}] "
-                        f"Soft failure ({result.status.value}) — trying next processor"
+                        "[TXN %s] [%s] Soft failure (%s) — trying next processor",
+                        request.transaction_id,
+                        processor.name,
+                        result.status.value,
                     )
                     break  # move to next processor
 
         # All processors exhausted
-        self._stats.record_final(approved=False, amount=request.amount, fee=None)
+        enqueue_stat((attempt_results, False, request.amount, None))
         total_latency_ms = (time.monotonic() - start) * 1000
         logger.error(
-            f"[TXN {request.transaction_id}] ALL PROCESSORS FAILED after {attempts} attempts"
+            "[TXN %s] ALL PROCESSORS FAILED after %d attempts",
+            request.transaction_id,
+            attempts,
         )
 
         decline_reason = last_result.decline_code if last_result else "all_processors_failed"
@@ -282,7 +536,7 @@ class FallbackEngine:
             else "soft"
         )
 
-        response = TransactionResponse(
+        response = TransactionResponse.model_construct(
             transaction_id=request.transaction_id,
             status="declined",
             amount=request.amount,
@@ -290,10 +544,12 @@ class FallbackEngine:
             decline_reason=decline_reason or "all_processors_failed",
             decline_type=decline_type,
             attempts=attempts,
-            processors_tried=processors_tried,
-            retry_log=retry_log,
+            processors_tried=list(processors_tried),
+            retry_log=retry_log or [],
             latency_ms=round(total_latency_ms, 2),
-            processed_at=datetime.now(timezone.utc),
+            processed_at=start_wall + timedelta(milliseconds=total_latency_ms),
         )
-        self._store_and_evict(request.transaction_id, response)
+        if self._stats_task is None:
+            self._drain_stats_queue()
+        await self._store_and_evict(request.transaction_id, response)
         return response
@@ -45,6 +45,11 @@ async def lifespan(app: FastAPI):
     app.state.stats_service = stats_service
     app.state.fallback_engine = fallback_engine
 
+    # Apply stat records in background batches, off the request hot path
+    fallback_engine.start_stats_worker()
+    # Sweep expired idempotency-cache entries on a coarse timer
+    fallback_engine.start_eviction_loop()
+
     logger.info(
         f"Processors loaded: {[p.name for p in processor_list]} | "
         f"CB window={settings.CB_ROLLING_WINDOW_SIZE} txns / "
@@ -57,6 +62,8 @@ async def lifespan(app: FastAPI):
 
     # --- Shutdown ---
     logger.info("FlexiPay Fallback Engine shutting down.")
+    await fallback_engine.stop_eviction_loop()
+    await fallback_engine.stop_stats_worker()
     snap = stats_service.snapshot()
     logger.info(
         f"Final stats: {snap.total_transactions} transactions | "
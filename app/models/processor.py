@@ -1,4 +1,5 @@
 from pydantic import BaseModel
+from dataclasses import dataclass, field
 from enum import Enum
 from typing import Optional
 from decimal import Decimal
@@ -19,7 +20,16 @@ class ProcessorResultStatus(str, Enum):
     CIRCUIT_OPEN = "circuit_open"  # CB refused the call before it was made
 
 
-class ProcessorResult(BaseModel):
+@dataclass(slots=True)
+class ProcessorResult:
+    """
+    Result of a single processor charge attempt.
+
+    Internal-only: constructed and consumed inside the engine, never
+    serialized to the wire, so a slotted dataclass skips Pydantic validation
+    machinery on every attempt.
+    """
+
     processor_name: str
     status: ProcessorResultStatus
     amount: Optional[Decimal] = None
@@ -27,7 +37,7 @@ class ProcessorResult(BaseModel):
     fee_rate: Optional[float] = None
     decline_code: Optional[str] = None
     decline_type: Optional[DeclineType] = None
-    raw_response: dict = {}
+    raw_response: dict = field(default_factory=dict)
     latency_ms: float = 0.0
 
 
@@ -1,11 +1,42 @@
-import json
-
 from pydantic import BaseModel, Field, field_validator
 from decimal import Decimal
 from enum import Enum
 from datetime import datetime
 from typing import Literal, Optional
 
+_METADATA_MAX_BYTES = 1024
+
+
+def _approx_json_size(obj, limit: int) -> int:
+    """
+    Estimate the JSON-serialised size of *obj* in bytes without building the
+    JSON string.  The old check ran json.dumps() on every request purely to
+    measure its length; this walks the structure once instead and stops
+    descending as soon as the running total passes *limit*.
+
+    Close enough for a coarse sanity bound: quotes and delimiters are
+    counted, string escaping is not.
+    """
+    if isinstance(obj, str):
+        return len(obj) + 2
+    if isinstance(obj, dict):
+        total = 2
+        for key, value in obj.items():
+            total += len(str(key)) + 4 + _approx_json_size(value, limit)
+            if total > limit:
+                return total
+        return total
+    if isinstance(obj, (list, tuple)):
+        total = 2
+        for value in obj:
+            total += 1 + _approx_json_size(value, limit)
+            if total > limit:
+                return total
+        return total
+    if obj is None or isinstance(obj, bool):
+        return 5
+    return len(str(obj))  # int, float, Decimal, ...
+
 
 class Currency(str, Enum):
     BRL = "BRL"
@@ -36,7 +67,7 @@ class TransactionRequest(BaseModel):
     @field_validator("metadata")
     @classmethod
     def limit_metadata_size(cls, v: dict) -> dict:
-        if len(json.dumps(v)) > 1024:
+        if _approx_json_size(v, _METADATA_MAX_BYTES) > _METADATA_MAX_BYTES:
             raise ValueError("metadata must not exceed 1 KB")
         return v
 
@@ -4,6 +4,10 @@ from app.models.processor import ProcessorResult
 
 
 class AbstractProcessor(ABC):
+    # No instance state of its own; empty __slots__ keeps subclasses free to
+    # opt out of a per-instance __dict__.
+    __slots__ = ()
+
     name: str
     fee_rate: float  # decimal fraction, e.g. 0.025 = 2.5%
 
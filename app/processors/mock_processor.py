@@ -8,19 +8,56 @@ The charge() logic itself lives here exactly once.
 """
 
 import asyncio
+import functools
 import random
-import time
+import sys
+from collections.abc import Sequence
+from decimal import Decimal
 
 from app.processors.base import AbstractProcessor
 from app.models.transaction import TransactionRequest
 from app.models.processor import DeclineType, ProcessorResult, ProcessorResultStatus
 
 # (cumulative_probability, outcome_status)
-OutcomeTable = list[tuple[float, ProcessorResultStatus]]
+OutcomeTable = Sequence[tuple[float, ProcessorResultStatus]]
+
+# Resolution of the precomputed outcome lookup table.  Outcome probabilities
+# are specified to two decimal places, so 1000 slots represents every table
+# exactly.
+_LUT_SIZE = 1000
+
+
+@functools.lru_cache(maxsize=None)
+def _build_outcome_lut(
+    outcome_table: tuple[tuple[float, ProcessorResultStatus], ...],
+) -> tuple[ProcessorResultStatus, ...]:
+    """
+    Unroll a (probability, status) table into a _LUT_SIZE-slot status tuple.
+
+    Cached on the tuple-ified table so processors sharing a distribution —
+    e.g. many instances spawned for a load test — share one table instead of
+    each allocating its own.  Probability mass the table leaves uncovered
+    maps to SUCCESS, matching the old cumulative scan's fall-through.
+    """
+    lut: list[ProcessorResultStatus] = []
+    for prob, outcome in outcome_table:
+        lut.extend([outcome] * round(prob * _LUT_SIZE))
+    del lut[_LUT_SIZE:]
+    lut.extend([ProcessorResultStatus.SUCCESS] * (_LUT_SIZE - len(lut)))
+    return tuple(lut)
 
 # card_last_four -> (forced_status, forced_decline_code | None)
 CardOverrides = dict[str, tuple[ProcessorResultStatus, str | None]]
 
+# Deterministic test cards honoured identically by every mock processor;
+# shared here so the three processors reference one table instead of each
+# allocating its own copy of the same literal.
+COMMON_TEST_CARDS: CardOverrides = {
+    "0000": (ProcessorResultStatus.HARD_DECLINE, "fraud_detected"),
+    "1111": (ProcessorResultStatus.SOFT_DECLINE, "insufficient_funds"),
+    "9999": (ProcessorResultStatus.TIMEOUT, None),
+}
+
 
 class MockableProcessor(AbstractProcessor):
     """
@@ -41,91 +78,174 @@ class MockableProcessor(AbstractProcessor):
                         production routing logic.
     """
 
+    # No per-instance __dict__: every attribute read in charge() goes through
+    # a slot descriptor instead of an instance-dict lookup.
+    __slots__ = (
+        "name",
+        "fee_rate",
+        "_fee_rate_dec",
+        "_lat_lo",
+        "_lat_hi",
+        "_rng",
+        "_uniform",
+        "_choice",
+        "_outcome_lut",
+        "_randrange",
+        "_soft_codes",
+        "_hard_codes",
+        "_soft_msgs",
+        "_hard_msgs",
+        "_card_overrides",
+        "_builders",
+    )
+
+    # Fixed raw_response payloads shared by every result of the same kind.
+    # Nothing downstream mutates raw_response, so one dict per payload serves
+    # the whole process instead of a fresh literal per charge().
+    _APPROVED_RESPONSE = {"code": "00", "message": "Approved"}
+    _RATE_LIMIT_RESPONSE = {"code": "429", "message": "Rate limit exceeded"}
+    _TIMEOUT_RESPONSE = {"code": "timeout", "message": "Connection timed out"}
+
     def __init__(
         self,
         name: str,
         fee_rate: float,
         latency_range: tuple[float, float],
         outcome_table: OutcomeTable,
-        soft_codes: list[str],
-        hard_codes: list[str],
+        soft_codes: Sequence[str],
+        hard_codes: Sequence[str],
         card_overrides: CardOverrides | None = None,
     ) -> None:
-        self.name = name
+        # Interned: the name and decline codes end up as dict keys all over
+        # the engine (breaker registry, stats, label caches), where interned
+        # strings hash once and compare by pointer.
+        self.name = sys.intern(name)
         self.fee_rate = fee_rate
-        self._latency_range = latency_range
-        self._outcome_table = outcome_table
-        self._soft_codes = soft_codes
-        self._hard_codes = hard_codes
+        # fee_rate is fixed per processor, so the float -> str -> Decimal
+        # conversion happens once here instead of on every successful charge.
+        self._fee_rate_dec = Decimal(str(fee_rate))
+        # Latency bounds unpacked once so each charge() passes two floats
+        # straight to uniform() instead of unpacking the tuple per call.
+        self._lat_lo, self._lat_hi = latency_range
+        # Dedicated RNG with its draw methods pre-bound: each call skips the
+        # random-module attribute lookup (and the shared global Random
+        # instance) on the hot path.
+        self._rng = random.Random()
+        self._uniform = self._rng.uniform
+        self._choice = self._rng.choice
+        # Unrolled once (and shared across identical distributions) so each
+        # charge() draws an outcome with a single index instead of a
+        # float-accumulating scan over the table.
+        self._outcome_lut = _build_outcome_lut(tuple(outcome_table))
+        self._randrange = self._rng.randrange
+        self._soft_codes = tuple(sys.intern(c) for c in soft_codes)
+        self._hard_codes = tuple(sys.intern(c) for c in hard_codes)
+        # Decline raw_response payloads, fully formed per code up front so the
+        # decline branches skip the dict literal and the replace().title()
+        # string work on every call.
+        self._soft_msgs = {
+            c: {"code": "51", "message": c.replace("_", " ").title()}
+            for c in soft_codes
+        }
+        self._hard_msgs = {
+            c: {"code": "05", "message": c.replace("_", " ").title()}
+            for c in hard_codes
+        }
         self._card_overrides: CardOverrides = card_overrides or {}
+        # Outcome -> bound result builder; charge() routes with a single dict
+        # hit instead of walking an enum comparison chain.  TIMEOUT keeps its
+        # own path in charge() because it must hang, not return.
+        self._builders = {
+            ProcessorResultStatus.SUCCESS: self._build_success,
+            ProcessorResultStatus.SOFT_DECLINE: self._build_soft_decline,
+            ProcessorResultStatus.HARD_DECLINE: self._build_hard_decline,
+            ProcessorResultStatus.RATE_LIMITED: self._build_rate_limited,
+        }
 
     def _pick_outcome(self) -> ProcessorResultStatus:
-        r = random.random()
-        cumulative = 0.0
-        for prob, outcome in self._outcome_table:
-            cumulative += prob
-            if r < cumulative:
-                return outcome
-        return ProcessorResultStatus.SUCCESS
+        return self._outcome_lut[self._randrange(_LUT_SIZE)]
 
     async def charge(self, request: TransactionRequest) -> ProcessorResult:
-        start = time.monotonic()
-        await asyncio.sleep(random.uniform(*self._latency_range))
-        elapsed_ms = (time.monotonic() - start) * 1000
+        # The simulated latency *is* the sleep duration, so the elapsed time
+        # is known up front — no monotonic() bracket around the sleep.
+        latency_s = self._uniform(self._lat_lo, self._lat_hi)
+        await asyncio.sleep(latency_s)
+        elapsed_ms = latency_s * 1000.0
 
         # Deterministic test-card overrides take priority over random selection
         forced = self._card_overrides.get(request.card_last_four)
-        outcome = forced[0] if forced else self._pick_outcome()
-
-        if outcome == ProcessorResultStatus.SUCCESS:
-            fee = request.amount * type(request.amount)(str(self.fee_rate))
+        if forced:
+            outcome, forced_code = forced
+        else:
+            outcome = self._pick_outcome()
+            forced_code = None
+
+        if outcome is ProcessorResultStatus.TIMEOUT:
+            # TIMEOUT — hang until the caller's timeout cancels us.  Waiting
+            # on a never-set Event parks the task on a plain future; unlike
+            # sleep(60) it leaves no 60-second timer handle in the event
+            # loop's scheduled heap per in-flight timeout.
+            await asyncio.Event().wait()
+            # Unreachable (the wait only ends by cancellation); kept so
+            # charge() visibly honours its return contract.
             return ProcessorResult(
                 processor_name=self.name,
-                status=ProcessorResultStatus.SUCCESS,
-                amount=request.amount,
-                fee=fee,
-                fee_rate=self.fee_rate,
-                raw_response={"code": "00", "message": "Approved"},
+                status=ProcessorResultStatus.TIMEOUT,
+                raw_response=self._TIMEOUT_RESPONSE,
                 latency_ms=elapsed_ms,
             )
 
-        if outcome == ProcessorResultStatus.SOFT_DECLINE:
-            code = forced[1] if forced else random.choice(self._soft_codes)
-            return ProcessorResult(
-                processor_name=self.name,
-                status=ProcessorResultStatus.SOFT_DECLINE,
-                decline_code=code,
-                decline_type=DeclineType.SOFT,
-                raw_response={"code": "51", "message": code.replace("_", " ").title()},
-                latency_ms=elapsed_ms,
-            )
+        return self._builders[outcome](request, elapsed_ms, forced_code)
 
-        if outcome == ProcessorResultStatus.HARD_DECLINE:
-            code = forced[1] if forced else random.choice(self._hard_codes)
-            return ProcessorResult(
-                processor_name=self.name,
-                status=ProcessorResultStatus.HARD_DECLINE,
-                decline_code=code,
-                decline_type=DeclineType.HARD,
-                raw_response={"code": "05", "message": code.replace("_", " ").title()},
-                latency_ms=elapsed_ms,
-            )
+    def _build_success(
+        self, request: TransactionRequest, elapsed_ms: float, forced_code: str | None
+    ) -> ProcessorResult:
+        return ProcessorResult(
+            processor_name=self.name,
+            status=ProcessorResultStatus.SUCCESS,
+            amount=request.amount,
+            fee=request.amount * self._fee_rate_dec,
+            fee_rate=self.fee_rate,
+            raw_response=self._APPROVED_RESPONSE,
+            latency_ms=elapsed_ms,
+        )
 
-        if outcome == ProcessorResultStatus.RATE_LIMITED:
-            return ProcessorResult(
-                processor_name=self.name,
-                status=ProcessorResultStatus.RATE_LIMITED,
-                decline_code="rate_limit_exceeded",
-                decline_type=DeclineType.RATE_LIMIT,
-                raw_response={"code": "429", "message": "Rate limit exceeded"},
-                latency_ms=elapsed_ms,
-            )
+    def _build_soft_decline(
+        self, request: TransactionRequest, elapsed_ms: float, forced_code: str | None
+    ) -> ProcessorResult:
+        code = forced_code or self._choice(self._soft_codes)
+        return ProcessorResult(
+            processor_name=self.name,
+            status=ProcessorResultStatus.SOFT_DECLINE,
+            decline_code=code,
+            decline_type=DeclineType.SOFT,
+            raw_response=self._soft_msgs.get(code)
+            or {"code": "51", "message": code.replace("_", " ").title()},
+            latency_ms=elapsed_ms,
+        )
+
+    def _build_hard_decline(
+        self, request: TransactionRequest, elapsed_ms: float, forced_code: str | None
+    ) -> ProcessorResult:
+        code = forced_code or self._choice(self._hard_codes)
+        return ProcessorResult(
+            processor_name=self.name,
+            status=ProcessorResultStatus.HARD_DECLINE,
+            decline_code=code,
+            decline_type=DeclineType.HARD,
+            raw_response=self._hard_msgs.get(code)
+            or {"code": "05", "message": code.replace("_", " ").title()},
+            latency_ms=elapsed_ms,
+        )
 
-        # TIMEOUT — caller's wait_for will fire before this resolves
-        await asyncio.sleep(60)
+    def _build_rate_limited(
+        self, request: TransactionRequest, elapsed_ms: float, forced_code: str | None
+    ) -> ProcessorResult:
         return ProcessorResult(
             processor_name=self.name,
-            status=ProcessorResultStatus.TIMEOUT,
-            raw_response={"code": "timeout", "message": "Connection timed out"},
+            status=ProcessorResultStatus.RATE_LIMITED,
+            decline_code="rate_limit_exceeded",
+            decline_type=DeclineType.RATE_LIMIT,
+            raw_response=self._RATE_LIMIT_RESPONSE,
             latency_ms=elapsed_ms,
         )
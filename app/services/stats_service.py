@@ -1,110 +1,266 @@
 import time
 import threading
-from collections import defaultdict
+from contextlib import ExitStack
 from decimal import Decimal
 
 from app.models.processor import ProcessorResult, ProcessorResultStatus
 from app.models.stats import StatsResponse, ProcessorStats
 
+# Pre-bound: call sites pay one LOAD_GLOBAL instead of a module attribute
+# walk per clock read.
+_monotonic = time.monotonic
+
 
 class StatsService:
     """
     In-memory accumulator for transaction statistics.
-    All mutations are protected by a Lock for thread-safety.
+
+    Locking is striped: each processor's counters are guarded by their own
+    lock and the transaction-level totals by a separate global lock, so
+    concurrent attempts against different processors never contend.
+    snapshot() acquires the registration lock, then the stripes in
+    sorted-name order, then the global lock (writers only ever hold a single
+    lock, so the ordering alone rules out deadlock).
 
     Trade-off: data is lost on restart. In production, this would
     be backed by Redis or a time-series database.
     """
 
     def __init__(self):
-        self._lock = threading.Lock()
-        self._started_at = time.monotonic()
+        self._global_lock = threading.Lock()
+        self._proc_locks: dict[str, threading.Lock] = {}
+        self._register_lock = threading.Lock()
+        self._started_at = _monotonic()
 
         self._total_transactions = 0
         self._total_approved = 0
         self._total_declined = 0
-        self._total_volume = Decimal("0")
-        self._total_fees = Decimal("0")
-
-        # per_processor stats keyed by processor name
-        self._per_processor: dict[str, dict] = defaultdict(lambda: {
-            "count": 0,
-            "volume": Decimal("0"),
-            "fees": Decimal("0"),
-            "success": 0,
-            "hard_decline": 0,
-            "soft_decline": 0,
-            "timeout": 0,
-            "rate_limited": 0,
-            "latency_sum": 0.0,
-        })
+        # Money accumulates as plain ints on the hot path — volume in cents
+        # (amounts are validated to two decimal places) and fees in
+        # micro-units (amount x rate carries up to five) — so each update is
+        # a native int add instead of an allocating Decimal.__add__.
+        # snapshot() scales back to Decimal on the way out.
+        self._total_volume_cents = 0
+        self._total_fees_micros = 0
+
+        # Per-processor counters in structure-of-arrays layout: a name maps
+        # to a small index once, and every counter is a parallel list indexed
+        # by it.  Each update is then a list index instead of hashing a
+        # string key into a per-processor dict of counters.
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+        self._count: list[int] = []
+        self._latency_sum: list[float] = []
+        self._volume_cents: list[int] = []
+        self._fees_micros: list[int] = []
+        self._success: list[int] = []
+        self._hard_decline: list[int] = []
+        self._soft_decline: list[int] = []
+        self._timeout: list[int] = []
+        self._rate_limited: list[int] = []
+        self._counter_arrays = (
+            self._count,
+            self._volume_cents,
+            self._fees_micros,
+            self._success,
+            self._hard_decline,
+            self._soft_decline,
+            self._timeout,
+            self._rate_limited,
+        )
+        # status -> counter array, so recording bumps the right counter with
+        # one dict hit instead of walking an enum comparison chain.  SUCCESS
+        # keeps its own branch for the money fields; statuses without a
+        # counter (CIRCUIT_OPEN) fall through untallied, as before.
+        self._status_arrays = {
+            ProcessorResultStatus.SUCCESS: self._success,
+            ProcessorResultStatus.HARD_DECLINE: self._hard_decline,
+            ProcessorResultStatus.SOFT_DECLINE: self._soft_decline,
+            ProcessorResultStatus.TIMEOUT: self._timeout,
+            ProcessorResultStatus.RATE_LIMITED: self._rate_limited,
+        }
+
+    def _lock_for(self, processor_name: str) -> threading.Lock:
+        # dict.get / dict.setdefault are both GIL-atomic; setdefault returns
+        # the winner if two threads race the first attempt for a name.
+        lock = self._proc_locks.get(processor_name)
+        if lock is None:
+            lock = self._proc_locks.setdefault(processor_name, threading.Lock())
+        return lock
+
+    def _id_for(self, processor_name: str) -> int:
+        i = self._ids.get(processor_name)
+        if i is not None:
+            return i
+        # First sighting: extend every parallel array by one slot under the
+        # registration lock so indices stay aligned, then publish the id.
+        with self._register_lock:
+            i = self._ids.get(processor_name)
+            if i is None:
+                i = len(self._names)
+                self._names.append(processor_name)
+                self._latency_sum.append(0.0)
+                for arr in self._counter_arrays:
+                    arr.append(0)
+                self._ids[processor_name] = i
+        return i
 
     def record_attempt(self, result: ProcessorResult) -> None:
         """Called by FallbackEngine after each individual processor attempt."""
-        with self._lock:
-            p = self._per_processor[result.processor_name]
-            p["count"] += 1
-            p["latency_sum"] += result.latency_ms
-
-            if result.status == ProcessorResultStatus.SUCCESS:
-                p["success"] += 1
-                if result.amount:
-                    p["volume"] += result.amount
-                if result.fee:
-                    p["fees"] += result.fee
-            elif result.status == ProcessorResultStatus.HARD_DECLINE:
-                p["hard_decline"] += 1
-            elif result.status == ProcessorResultStatus.SOFT_DECLINE:
-                p["soft_decline"] += 1
-            elif result.status == ProcessorResultStatus.TIMEOUT:
-                p["timeout"] += 1
-            elif result.status == ProcessorResultStatus.RATE_LIMITED:
-                p["rate_limited"] += 1
+        i = self._id_for(result.processor_name)
+        with self._lock_for(result.processor_name):
+            self._record_attempt_locked(i, result)
+
+    def _record_attempt_locked(self, i: int, result: ProcessorResult) -> None:
+        self._count[i] += 1
+        self._latency_sum[i] += result.latency_ms
+
+        status = result.status
+        arr = self._status_arrays.get(status)
+        if arr is not None:
+            arr[i] += 1
+        if status is ProcessorResultStatus.SUCCESS:
+            if result.amount:
+                self._volume_cents[i] += int(result.amount.scaleb(2))
+            if result.fee:
+                self._fees_micros[i] += int(result.fee.scaleb(6))
 
     def record_final(self, approved: bool, amount: Decimal, fee: Decimal | None) -> None:
         """Called once per transaction with the final outcome."""
-        with self._lock:
-            self._total_transactions += 1
-            if approved:
-                self._total_approved += 1
-                self._total_volume += amount
-                if fee:
-                    self._total_fees += fee
-            else:
-                self._total_declined += 1
+        with self._global_lock:
+            self._record_final_locked(approved, amount, fee)
+
+    def _record_final_locked(self, approved: bool, amount: Decimal, fee: Decimal | None) -> None:
+        self._total_transactions += 1
+        if approved:
+            self._total_approved += 1
+            self._total_volume_cents += int(amount.scaleb(2))
+            if fee:
+                self._total_fees_micros += int(fee.scaleb(6))
+        else:
+            self._total_declined += 1
+
+    def apply_batch(self, records: list[tuple]) -> None:
+        """
+        Apply a batch of queued stat records.
+
+        Each record is (attempts, approved, amount, fee) — one whole
+        transaction.  Attempts are grouped by processor first so every stripe
+        is acquired at most once per batch, then the finals are folded in
+        under one global-lock acquisition.
+        """
+        by_proc: dict[str, list[ProcessorResult]] = {}
+        finals: list[tuple] = []
+        # Bound methods hoisted out of the loops — LOAD_FAST per iteration
+        # instead of attribute lookups.
+        group_for = by_proc.setdefault
+        add_final = finals.append
+        for attempts, approved, amount, fee in records:
+            for result in attempts:
+                group_for(result.processor_name, []).append(result)
+            add_final((approved, amount, fee))
+
+        record_attempt = self._record_attempt_locked
+        for name, results in by_proc.items():
+            i = self._id_for(name)
+            with self._lock_for(name):
+                for result in results:
+                    record_attempt(i, result)
+        record_final = self._record_final_locked
+        with self._global_lock:
+            for final in finals:
+                record_final(*final)
+
+    def reset(self) -> None:
+        """
+        Zero every counter in place.  Registered processors keep their ids,
+        locks and array slots, so a long-lived instance (tests, admin reset)
+        avoids re-registration churn.
+        """
+        with ExitStack() as stack:
+            # Registration lock first: it keeps the parallel arrays from
+            # growing mid-copy (see snapshot()).
+            stack.enter_context(self._register_lock)
+            for name in sorted(self._proc_locks):
+                stack.enter_context(self._proc_locks[name])
+            stack.enter_context(self._global_lock)
+
+            self._started_at = _monotonic()
+            self._total_transactions = 0
+            self._total_approved = 0
+            self._total_declined = 0
+            self._total_volume_cents = 0
+            self._total_fees_micros = 0
+            for i in range(len(self._latency_sum)):
+                self._latency_sum[i] = 0.0
+            for arr in self._counter_arrays:
+                for i in range(len(arr)):
+                    arr[i] = 0
 
     def snapshot(self) -> StatsResponse:
-        with self._lock:
-            uptime = time.monotonic() - self._started_at
-            approval_rate = (
-                self._total_approved / self._total_transactions
-                if self._total_transactions > 0
-                else 0.0
-            )
+        # Copy raw counter values under the locks; all derived arithmetic,
+        # Decimal scaling and model construction happen after release, so
+        # writers are only ever blocked for a handful of list copies.
+        with ExitStack() as stack:
+            # Registration lock first: _id_for appends to the parallel arrays
+            # one at a time under it, so copying without it could catch
+            # _names longer than the counter arrays mid-registration.
+            # Writers never hold it together with another lock, so the
+            # ordering stays deadlock-free.
+            stack.enter_context(self._register_lock)
+            for name in sorted(self._proc_locks):
+                stack.enter_context(self._proc_locks[name])
+            stack.enter_context(self._global_lock)
+
+            uptime = _monotonic() - self._started_at
+            names = list(self._names)
+            count = list(self._count)
+            latency_sum = list(self._latency_sum)
+            volume_cents = list(self._volume_cents)
+            fees_micros = list(self._fees_micros)
+            success = list(self._success)
+            hard_decline = list(self._hard_decline)
+            soft_decline = list(self._soft_decline)
+            timeout = list(self._timeout)
+            rate_limited = list(self._rate_limited)
+            total_transactions = self._total_transactions
+            total_approved = self._total_approved
+            total_declined = self._total_declined
+            total_volume_cents = self._total_volume_cents
+            total_fees_micros = self._total_fees_micros
 
-            per_processor = {}
-            for name, p in self._per_processor.items():
-                avg_latency = p["latency_sum"] / p["count"] if p["count"] > 0 else 0.0
-                per_processor[name] = ProcessorStats(
-                    processor_name=name,
-                    transaction_count=p["count"],
-                    total_volume=p["volume"],
-                    total_fees=p["fees"],
-                    success_count=p["success"],
-                    hard_decline_count=p["hard_decline"],
-                    soft_decline_count=p["soft_decline"],
-                    timeout_count=p["timeout"],
-                    rate_limited_count=p["rate_limited"],
-                    avg_latency_ms=round(avg_latency, 2),
-                )
-
-            return StatsResponse(
-                total_transactions=self._total_transactions,
-                total_approved=self._total_approved,
-                total_declined=self._total_declined,
-                total_volume=self._total_volume,
-                total_fees_collected=self._total_fees,
-                overall_approval_rate=round(approval_rate, 4),
-                per_processor=per_processor,
-                uptime_seconds=round(uptime, 2),
+        approval_rate = (
+            total_approved / total_transactions if total_transactions > 0 else 0.0
+        )
+
+        # model_construct: every field below is already the exact annotated
+        # type (int, float, Decimal), so the models are assembled without a
+        # validation pass.  /stats still validates once at the response
+        # boundary via its response_model.
+        per_processor = {}
+        for i, name in enumerate(names):
+            c = count[i]
+            avg_latency = latency_sum[i] / c if c > 0 else 0.0
+            per_processor[name] = ProcessorStats.model_construct(
+                processor_name=name,
+                transaction_count=c,
+                total_volume=Decimal(volume_cents[i]).scaleb(-2),
+                total_fees=Decimal(fees_micros[i]).scaleb(-6),
+                success_count=success[i],
+                hard_decline_count=hard_decline[i],
+                soft_decline_count=soft_decline[i],
+                timeout_count=timeout[i],
+                rate_limited_count=rate_limited[i],
+                avg_latency_ms=round(avg_latency, 2),
             )
+
+        return StatsResponse.model_construct(
+            total_transactions=total_transactions,
+            total_approved=total_approved,
+            total_declined=total_declined,
+            total_volume=Decimal(total_volume_cents).scaleb(-2),
+            total_fees_collected=Decimal(total_fees_micros).scaleb(-6),
+            overall_approval_rate=round(approval_rate, 4),
+            per_processor=per_processor,
+            uptime_seconds=round(uptime, 2),
+        )
@@ -0,0 +1,25 @@
+"""Shared pytest fixtures.
+
+Settings() runs the full pydantic-settings validation pass on every
+construction, which dominates the cost of building an engine in the unit
+tests — one session-scoped instance serves every test that doesn't need
+custom values.
+"""
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.config import Settings
+from app.main import app
+
+
+@pytest.fixture(scope="session")
+def settings() -> Settings:
+    return Settings()
+
+
+@pytest.fixture(scope="session")
+def client():
+    """Shared TestClient — the app lifespan runs once per pytest session."""
+    with TestClient(app) as c:
+        yield c
@@ -19,8 +19,7 @@ Make sure the server is running first:
     uvicorn app.main:app --reload
 """
 
-import json
-import time
+import asyncio
 import random
 import httpx
 
@@ -64,8 +63,8 @@ def print_response(resp: dict) -> None:
     print(f"  Latency      : {resp.get('latency_ms')}ms")
 
 
-def post_transaction(client: httpx.Client, payload: dict) -> dict:
-    resp = client.post(f"{BASE_URL}/transactions", json=payload)
+async def post_transaction(client: httpx.AsyncClient, payload: dict) -> dict:
+    resp = await client.post(f"{BASE_URL}/transactions", json=payload)
     resp.raise_for_status()
     return resp.json()
 
@@ -85,17 +84,17 @@ def make_txn(
     }
 
 
-def run_demo():
+async def run_demo():
     print(c("bold", "\n" + "═" * 60))
     print(c("bold", "   FlexiPay Processor Fallback Engine — Demo"))
     print(c("bold", "═" * 60))
 
-    with httpx.Client(timeout=30) as client:
+    async with httpx.AsyncClient(timeout=30) as client:
 
         # ── 0. Health check ───────────────────────────────────────
         separator("0. Service health check")
         try:
-            r = client.get(f"{BASE_URL}/")
+            r = await client.get(f"{BASE_URL}/")
             r.raise_for_status()
             print(f"  {c('green', 'Service is UP')} — {r.json()['status']}")
         except Exception as e:
@@ -106,11 +105,16 @@ def run_demo():
         # ── 1. Normal transactions (mixed bag) ────────────────────
         separator("1. Normal transactions (10 random)")
         approved = declined = 0
-        for i in range(10):
-            currencies = ["BRL", "USD", "MXN"]
-            amounts = ["49.90", "99.00", "199.50", "350.00", "15.00"]
-            txn = make_txn(f"normal-{i}", random.choice(amounts), random.choice(currencies))
-            result = post_transaction(client, txn)
+        currencies = ["BRL", "USD", "MXN"]
+        amounts = ["49.90", "99.00", "199.50", "350.00", "15.00"]
+        txns = [
+            make_txn(f"normal-{i}", random.choice(amounts), random.choice(currencies))
+            for i in range(10)
+        ]
+        # Independent transactions: fire the batch concurrently and print in
+        # submission order once every response is in.
+        results = await asyncio.gather(*(post_transaction(client, txn) for txn in txns))
+        for i, result in enumerate(results):
             icon = c("green", "✓") if result["status"] == "approved" else c("red", "✗")
             proc = result.get("processor_used") or "—"
             print(
@@ -126,7 +130,7 @@ def run_demo():
 
         # ── 2. Check processor status ─────────────────────────────
         separator("2. Processor health status")
-        status_resp = client.get(f"{BASE_URL}/processors/status")
+        status_resp = await client.get(f"{BASE_URL}/processors/status")
         for ps in status_resp.json():
             state_color = "green" if ps["state"] == "closed" else "red"
             rate = f"{ps['success_rate']:.1%}" if ps["success_rate"] is not None else "N/A"
@@ -140,12 +144,12 @@ def run_demo():
         # ── 3. Force circuit breaker trip ─────────────────────────
         separator("3. Circuit breaker: force-tripping VortexPay")
         print("  Step 1: Reset VortexPay circuit breaker (clean window)...")
-        r = client.post(f"{BASE_URL}/processors/VortexPay/reset")
+        r = await client.post(f"{BASE_URL}/processors/VortexPay/reset")
         r.raise_for_status()
         print(f"         {c('green', 'CB reset to CLOSED')}")
 
         print("  Step 2: Inject 6 synthetic failures → success-rate = 0% < 20% threshold...")
-        r = client.post(f"{BASE_URL}/processors/VortexPay/inject-failures", params={"count": 6})
+        r = await client.post(f"{BASE_URL}/processors/VortexPay/inject-failures", params={"count": 6})
         r.raise_for_status()
         inj = r.json()
         state_color = "red" if inj["state"] == "open" else "yellow"
@@ -160,9 +164,11 @@ def run_demo():
         print("  Step 3: Send 5 transactions — VortexPay should be skipped (circuit OPEN)...\n")
 
         circuit_opened = False
+        # Sequential on purpose: each probe's fallback chain depends on the
+        # breaker state the previous one left behind.
         for i in range(5):
             txn = make_txn(f"burst-{i}", "75.00")
-            result = post_transaction(client, txn)
+            result = await post_transaction(client, txn)
             chain = result["processors_tried"]
             has_circuit_open = any("circuit_open" in step for step in chain)
             if has_circuit_open:
@@ -177,7 +183,7 @@ def run_demo():
 
         # ── 4. Status after burst ─────────────────────────────────
         separator("4. Processor health after burst")
-        status_resp = client.get(f"{BASE_URL}/processors/status")
+        status_resp = await client.get(f"{BASE_URL}/processors/status")
         for ps in status_resp.json():
             state_color = "green" if ps["state"] == "closed" else ("yellow" if ps["state"] == "half_open" else "red")
             rate = f"{ps['success_rate']:.1%}" if ps["success_rate"] is not None else "N/A"
@@ -191,7 +197,7 @@ def run_demo():
 
         # ── 5. Final stats ────────────────────────────────────────
         separator("5. Aggregate statistics")
-        stats = client.get(f"{BASE_URL}/stats").json()
+        stats = (await client.get(f"{BASE_URL}/stats")).json()
         print(f"  Total transactions : {stats['total_transactions']}")
         print(f"  Approved           : {stats['total_approved']}")
         print(f"  Declined           : {stats['total_declined']}")
@@ -216,4 +222,4 @@ def run_demo():
 
 
 if __name__ == "__main__":
-    run_demo()
+    asyncio.run(run_demo())
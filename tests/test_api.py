@@ -2,8 +2,8 @@
 API-level integration tests for the FlexiPay Fallback Engine.
 
 Uses FastAPI's TestClient (synchronous) so no pytest-asyncio is needed.
-The lifespan context manager (startup/shutdown) runs automatically when
-the client is used as a context manager.
+The lifespan context manager (startup/shutdown) runs automatically via the
+session-scoped `client` fixture in conftest.py.
 
 Test cards used for deterministic outcomes:
   "0000" -> HARD_DECLINE (fraud_detected) on all processors
@@ -11,20 +11,8 @@ Test cards used for deterministic outcomes:
   "4242" -> random outcome (only used where shape, not outcome, is asserted)
 """
 
-import pytest
-from fastapi.testclient import TestClient
-
-from app.main import app
-
-# ---------------------------------------------------------------------------
-# Shared client — lifespan runs once for the whole module
-# ---------------------------------------------------------------------------
-
-@pytest.fixture(scope="module")
-def client():
-    with TestClient(app) as c:
-        yield c
-
+# The shared `client` fixture lives in conftest.py (session scope), so the
+# app lifespan runs once for the whole pytest session rather than per module.
 
 # Base payload used as a starting point; tests override individual fields.
 _BASE = {
@@ -41,6 +29,12 @@ def _txn(**overrides) -> dict:
     return {**_BASE, **overrides}
 
 
+# Fixed payloads built once at import; the tests only read them.
+_HARD_DECLINE_PAYLOAD = _txn(transaction_id="shape-001", card_last_four="0000")
+# JSON-serialises to ~1 036 bytes, just over the 1 024-byte metadata cap.
+_BIG_METADATA_PAYLOAD = _txn(transaction_id="big-meta", metadata={"key": "x" * 1025})
+
+
 # ---------------------------------------------------------------------------
 # 1. POST /transactions — 200 with correct response shape
 # ---------------------------------------------------------------------------
@@ -51,8 +45,7 @@ def test_post_transaction_response_shape(client):
     We use it here because it is fast and deterministic, letting us assert
     the full response shape without flakiness.
     """
-    payload = _txn(transaction_id="shape-001", card_last_four="0000")
-    r = client.post("/transactions", json=payload)
+    r = client.post("/transactions", json=_HARD_DECLINE_PAYLOAD)
 
     assert r.status_code == 200
     data = r.json()
@@ -109,11 +102,7 @@ def test_post_transaction_unsupported_currency(client):
 
 def test_post_transaction_metadata_too_large(client):
     """JSON-serialised metadata must not exceed 1 024 bytes."""
-    big_metadata = {"key": "x" * 1025}  # serialises to ~1 036 bytes
-    r = client.post(
-        "/transactions",
-        json=_txn(transaction_id="big-meta", metadata=big_metadata),
-    )
+    r = client.post("/transactions", json=_BIG_METADATA_PAYLOAD)
     assert r.status_code == 422
 
 